@@ -11,8 +11,9 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN
+from .const import DOMAIN, UPDATE_INTERVAL_IDLE_MINUTES
 from .coordinator import DriveeDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -40,10 +41,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     username = str(entry.data.get("username", ""))
     password = str(entry.data.get("password", ""))
 
-    # Create client
+    # Create client on Home Assistant's shared aiohttp session so connections
+    # (and TLS handshakes) are reused across polls
     client: DriveeClient = DriveeClient(
         username=username,
         password=password,
+        session=async_get_clientsession(hass),
     )
 
     # Create coordinator for updating data
@@ -51,18 +54,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass,
         _LOGGER,
         name="DriveeDataUpdateCoordinator",
-        update_interval=timedelta(minutes=10),
+        update_interval=timedelta(minutes=UPDATE_INTERVAL_IDLE_MINUTES),
         client=client,
         config_entry=entry,
     )
 
-    # Fetch initial data
+    # Fetch initial data; failures raise ConfigEntryNotReady so setup is
+    # retried, and authentication errors start the reauth flow
     await coordinator.async_config_entry_first_refresh()
 
     # Store coordinator
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    # Forward the config entry to the sensor platform
+    # Forward the config entry to the platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
@@ -70,12 +74,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    coordinator: DriveeDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-
-    # Close client session if available
-    if hasattr(coordinator.client, "close"):
-        _LOGGER.debug("Closing Drivee client connection")
-        await coordinator.client.close()
+    # No client session to close: the shared aiohttp session is owned by HA
 
     # Unload platforms
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from abc import abstractmethod
+
+from drivee_client import ChargePoint
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
@@ -30,29 +33,72 @@ async def async_setup_entry(
     )
 
 
-class DriveeEvseConnectedBinarySensor(DriveeBaseEntity, BinarySensorEntity):
-    """Binary sensor indicating if the EVSE is connected."""
+class DriveeBaseBinarySensorEntity(DriveeBaseEntity, BinarySensorEntity):
+    """Base binary sensor that caches its state once per coordinator update.
+
+    The charge point is looked up a single time per update and the result is
+    stored in `_attr_is_on`/`_attr_available`, so state reads are plain
+    attribute loads.
+    """
 
     __slots__ = ()
-    _attr_translation_key = "connection"
-    _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if EVSE is connected, False if not, or None if unknown."""
+    def __init__(self, coordinator: DriveeDataUpdateCoordinator) -> None:
+        """Initialize the binary sensor from the current coordinator data."""
+        super().__init__(coordinator)
+        self._update_from_charge_point()
+
+    @abstractmethod
+    def _is_on_from_charge_point(self, charge_point: ChargePoint) -> bool | None:
+        """Return the binary state for a charge point with EVSE data.
+
+        Args:
+            charge_point: The current charge point; `evse` is guaranteed set.
+
+        Returns:
+            bool | None: The sensor state, or None if unknown.
+        """
+
+    def _update_from_charge_point(self) -> None:
+        """Cache `_attr_is_on` and `_attr_available` from the coordinator data."""
         charge_point = self._get_charge_point()
-        if charge_point is None:
-            return None
-        return charge_point.evse.is_connected
+        if charge_point is None or charge_point.evse is None:
+            self._attr_available = False
+            self._attr_is_on = None
+            return
+        self._attr_available = True
+        self._attr_is_on = self._is_on_from_charge_point(charge_point)
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh the cached state in case data arrived after construction."""
+        await super().async_added_to_hass()
+        self._update_from_charge_point()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the cached state and write it to Home Assistant."""
+        self._update_from_charge_point()
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
-        """Return availability based on presence of EVSE connection data."""
-        charge_point = self._get_charge_point()
-        return charge_point is not None and charge_point.evse is not None
+        """Return True if EVSE data was present at the last coordinator update."""
+        return self._attr_available
 
 
-class DriveeChargingBinarySensor(DriveeBaseEntity, BinarySensorEntity):
+class DriveeEvseConnectedBinarySensor(DriveeBaseBinarySensorEntity):
+    """Binary sensor indicating if the EVSE is connected."""
+
+    __slots__ = ()
+    _attr_translation_key = "connection"
+    _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
+
+    def _is_on_from_charge_point(self, charge_point: ChargePoint) -> bool | None:
+        """Return True if EVSE is connected, False if not."""
+        return charge_point.evse.is_connected
+
+
+class DriveeChargingBinarySensor(DriveeBaseBinarySensorEntity):
     """Binary sensor for the Drivee charging state."""
 
     __slots__ = ()
@@ -60,16 +106,6 @@ class DriveeChargingBinarySensor(DriveeBaseEntity, BinarySensorEntity):
     _attr_icon: str = "mdi:ev-station"
     _attr_device_class = BinarySensorDeviceClass.RUNNING
 
-    @property
-    def is_on(self) -> bool | None:
+    def _is_on_from_charge_point(self, charge_point: ChargePoint) -> bool | None:
         """Return the charging status of the charge point."""
-        charge_point = self._get_charge_point()
-        if charge_point is None:
-            return None
         return charge_point.evse.is_charging
-
-    @property
-    def available(self) -> bool:
-        """Return True if charge point status data is present."""
-        charge_point = self._get_charge_point()
-        return charge_point is not None and charge_point.evse is not None
@@ -12,6 +12,7 @@ from drivee_client import DriveeClient
 from drivee_client.errors import AuthenticationError, DriveeError
 from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,11 +43,14 @@ class DriveeConfigFlow(config_entries.ConfigFlow, domain="drivee"):
         """
         errors: dict[str, str] = {}
         try:
-            async with DriveeClient(
+            # Use HA's shared session: no connector/SSL context is created on
+            # the event loop and there is nothing to close afterwards
+            client = DriveeClient(
                 username=username,
                 password=password,
-            ) as client:
-                await client.authenticate()
+                session=async_get_clientsession(self.hass),
+            )
+            await client.authenticate()
         except AuthenticationError:
             _LOGGER.warning("Authentication failed")
             errors["base"] = "invalid_auth"
@@ -56,8 +60,8 @@ class DriveeConfigFlow(config_entries.ConfigFlow, domain="drivee"):
         except DriveeError as err:
             _LOGGER.error("Drivee API error: %s", err)
             errors["base"] = "cannot_connect"
-        except Exception as err:
-            _LOGGER.exception("Unexpected error during authentication: %s", err)
+        except Exception:
+            _LOGGER.exception("Unexpected error during authentication")
             errors["base"] = "unknown"
             raise
         return errors
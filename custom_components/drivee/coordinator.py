@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime
 import logging
 from dataclasses import dataclass
@@ -16,7 +17,7 @@ from drivee_client.models.charging_history import ChargingHistory
 from drivee_client.models.charging_session import ChargingSession
 from drivee_client.models.price_periods import PricePeriods
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
@@ -24,20 +25,73 @@ from homeassistant.util import dt as dt_util
 from .const import (
     CACHE_DURATION_HOURS,
     UPDATE_INTERVAL_CHARGING_SECONDS,
+    UPDATE_INTERVAL_CONNECTED_SECONDS,
     UPDATE_INTERVAL_IDLE_MINUTES,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+def _charge_point_snapshot(charge_point: ChargePoint) -> tuple[object, ...]:
+    """Return the charge point values that entities and diagnostics read.
+
+    The client builds new, identity-compared model objects on every poll, so
+    change detection compares these plain values instead.
+
+    Args:
+        charge_point: The charge point to snapshot.
+
+    Returns:
+        tuple[object, ...]: Hashable values describing the visible state.
+    """
+    evse = charge_point.evse
+    if evse is None:
+        return (charge_point.name, None)
+    session = evse.session
+    session_values = (
+        (session.id, session.energy, session.power, session.amount)
+        if session is not None
+        else None
+    )
+    return (
+        charge_point.name,
+        evse.id,
+        evse.status,
+        evse.is_charging,
+        evse.is_connected,
+        evse.is_charging_session_active,
+        session_values,
+    )
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class DriveeData:
-    """Class to store Drivee API data."""
+    """Class to store Drivee API data.
+
+    Compared by value so the coordinator can skip notifying entities when a
+    poll returns the same data as the previous one.
+    """
 
     charge_point: ChargePoint
     charging_history: ChargingHistory
     price_periods: PricePeriods
 
+    def __eq__(self, other: object) -> bool:
+        """Return True if entities would show the same state for both.
+
+        The charge point is compared through a value snapshot. History and
+        prices come from the coordinator's caches, so an unchanged cache entry
+        is the same object and they are compared by identity.
+        """
+        if not isinstance(other, DriveeData):
+            return NotImplemented
+        return (
+            self.charging_history is other.charging_history
+            and self.price_periods is other.price_periods
+            and _charge_point_snapshot(self.charge_point)
+            == _charge_point_snapshot(other.charge_point)
+        )
+
     @property
     def last_session(self) -> ChargingSession | None:
         """Get the last charging session if available."""
@@ -50,9 +104,11 @@ class DriveeDataUpdateCoordinator(DataUpdateCoordinator[DriveeData]):
     """Coordinator to manage fetching Drivee data with intelligent caching.
 
     Features:
-    - Dynamic update intervals (30s when charging, 10min when idle)
+    - Dynamic update intervals (30s when charging, 1min when connected,
+      10min when idle)
     - Smart caching (1-hour TTL cache for history and prices using cachetools)
     - Session tracking (refreshes cache on session change)
+    - Change-only listener updates (entities are not notified for unchanged data)
     - Proper error handling with re-authentication support
     """
 
@@ -60,6 +116,7 @@ class DriveeDataUpdateCoordinator(DataUpdateCoordinator[DriveeData]):
     _history_cache: TTLCache
     _price_cache: TTLCache
     _last_session_id: str | None
+    _refresh_listeners: list[CALLBACK_TYPE]
     last_update_success_time: datetime.datetime | None
 
     def __init__(
@@ -88,6 +145,7 @@ class DriveeDataUpdateCoordinator(DataUpdateCoordinator[DriveeData]):
             name=name,
             update_interval=update_interval,
             config_entry=config_entry,
+            always_update=False,
         )
         self.client = client
 
@@ -97,8 +155,55 @@ class DriveeDataUpdateCoordinator(DataUpdateCoordinator[DriveeData]):
         self._price_cache = TTLCache(maxsize=1, ttl=cache_ttl_seconds)
 
         self._last_session_id = None
+        self._refresh_listeners = []
         self.last_update_success_time = None
 
+    @callback
+    def async_add_refresh_listener(
+        self, refresh_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for successful refreshes, whether or not the data changed.
+
+        Regular listeners are only called when the data changes, which is not
+        enough for state that tracks the refresh itself.
+
+        Args:
+            refresh_callback: Callback to run after each successful refresh.
+
+        Returns:
+            CALLBACK_TYPE: Function that removes the listener.
+        """
+        self._refresh_listeners.append(refresh_callback)
+
+        @callback
+        def remove_refresh_listener() -> None:
+            self._refresh_listeners.remove(refresh_callback)
+
+        return remove_refresh_listener
+
+    async def _async_refresh(
+        self,
+        log_failures: bool = True,
+        raise_on_auth_failed: bool = False,
+        scheduled: bool = False,
+        raise_on_entry_error: bool = False,
+    ) -> None:
+        """Refresh data and then notify the refresh listeners on success.
+
+        The listeners run once the new data and success flag are stored, so
+        they see the same state as the regular listeners.
+        """
+        await super()._async_refresh(
+            log_failures=log_failures,
+            raise_on_auth_failed=raise_on_auth_failed,
+            scheduled=scheduled,
+            raise_on_entry_error=raise_on_entry_error,
+        )
+        if not self.last_update_success:
+            return
+        for refresh_callback in list(self._refresh_listeners):
+            refresh_callback()
+
     @property
     def diagnostics_session_id(self) -> str | None:
         """Return the last known session ID for diagnostics."""
@@ -187,6 +292,25 @@ class DriveeDataUpdateCoordinator(DataUpdateCoordinator[DriveeData]):
         self._price_cache["data"] = data
         return data
 
+    @staticmethod
+    def _interval_for_charge_point(charge_point: ChargePoint) -> timedelta:
+        """Return the polling interval matching the current EVSE state.
+
+        Polls fast while charging, moderately while a car is plugged in (so a
+        session start is picked up quickly) and slowly when nothing is connected.
+
+        Args:
+            charge_point: The freshly fetched charge point.
+
+        Returns:
+            timedelta: The update interval to use for the next poll.
+        """
+        if charge_point.evse.is_charging:
+            return timedelta(seconds=UPDATE_INTERVAL_CHARGING_SECONDS)
+        if charge_point.evse.is_connected:
+            return timedelta(seconds=UPDATE_INTERVAL_CONNECTED_SECONDS)
+        return timedelta(minutes=UPDATE_INTERVAL_IDLE_MINUTES)
+
     async def _async_update_data(self) -> DriveeData:
         """Fetch data from API and build DriveeData.
 
@@ -196,6 +320,9 @@ class DriveeDataUpdateCoordinator(DataUpdateCoordinator[DriveeData]):
             ConfigEntryAuthFailed: Authentication failed, user needs to reconfigure.
             UpdateFailed: Communication error with the API.
         """
+        # Expected failures are logged at debug level only: the coordinator
+        # already logs the raised error once and suppresses repeats until the
+        # next successful update
         try:
             _LOGGER.debug("Starting data update cycle")
             charge_point = await self._async_fetch_charge_point()
@@ -211,19 +338,22 @@ class DriveeDataUpdateCoordinator(DataUpdateCoordinator[DriveeData]):
                 )
                 force = True
 
-            charging_history = await self._async_fetch_charging_history(force)
-            price_periods = await self._async_fetch_price_periods(force)
+            # History and prices are independent, so fetch them concurrently
+            charging_history, price_periods = await asyncio.gather(
+                self._async_fetch_charging_history(force),
+                self._async_fetch_price_periods(force),
+            )
 
         except AuthenticationError as err:
-            _LOGGER.error("Authentication failed: %s", err)
+            _LOGGER.debug("Authentication failed: %s", err)
             raise ConfigEntryAuthFailed(
                 "Authentication failed, please reconfigure the integration"
             ) from err
         except DriveeError as err:
-            _LOGGER.error("Drivee API error: %s", err)
+            _LOGGER.debug("Drivee API error: %s", err)
             raise UpdateFailed(f"Error communicating with Drivee API: {err}") from err
         except (ClientError, TimeoutError) as err:
-            _LOGGER.error("Connection error: %s", err)
+            _LOGGER.debug("Connection error: %s", err)
             raise UpdateFailed(f"Connection error: {err}") from err
         except Exception as err:
             # Catch all unexpected exceptions and convert to UpdateFailed to prevent
@@ -231,19 +361,16 @@ class DriveeDataUpdateCoordinator(DataUpdateCoordinator[DriveeData]):
             _LOGGER.exception("Unexpected error during data update")
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
-        # Update interval depends on charging state (avoid processing inside try)
-        new_interval = (
-            timedelta(seconds=UPDATE_INTERVAL_CHARGING_SECONDS)
-            if charge_point.evse.is_charging
-            else timedelta(minutes=UPDATE_INTERVAL_IDLE_MINUTES)
-        )
+        # Update interval depends on EVSE state (avoid processing inside try)
+        new_interval = self._interval_for_charge_point(charge_point)
 
         if new_interval != self.update_interval:
             _LOGGER.info(
-                "Adjusting update interval from %s to %s (charging: %s)",
+                "Adjusting update interval from %s to %s (charging: %s, connected: %s)",
                 self.update_interval,
                 new_interval,
                 charge_point.evse.is_charging,
+                charge_point.evse.is_connected,
             )
             self.update_interval = new_interval
 
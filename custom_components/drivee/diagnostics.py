@@ -18,27 +18,25 @@ async def async_get_config_entry_diagnostics(
     coordinator: DriveeDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
     # Get coordinator data safely
+    cp = coordinator.data.charge_point if coordinator.data else None
+    current_session_id = getattr(cp.evse.session, "id", None) if cp else None
     charge_point_data = {}
-    if coordinator.data and coordinator.data.charge_point:
-        cp = coordinator.data.charge_point
+    if cp:
+        evse = cp.evse
         charge_point_data = {
             "id": cp.id,
             "name": cp.name,
             "evse": {
-                "is_charging": cp.evse.is_charging,
-                "is_charging_session_active": cp.evse.is_charging_session_active,
-                "session_id": getattr(cp.evse.session, "id", None),
+                "is_charging": evse.is_charging,
+                "is_charging_session_active": evse.is_charging_session_active,
+                "session_id": current_session_id,
             },
         }
 
     # Session tracking
     session_tracking = {
         "last_session_id": coordinator.diagnostics_session_id,
-        "current_session_id": getattr(
-            coordinator.data.charge_point.evse.session if coordinator.data else None,
-            "id",
-            None,
-        ),
+        "current_session_id": current_session_id,
     }
 
     # Cache statistics
@@ -50,9 +50,10 @@ class DriveeBaseEntity(CoordinatorEntity[DriveeDataUpdateCoordinator]):
             ChargingSession | None: The current session if active, None otherwise.
         """
         charge_point = self._get_charge_point()
-        if charge_point and charge_point.evse and charge_point.evse.session:
-            return charge_point.evse.session
-        return None
+        if charge_point is None:
+            return None
+        evse = charge_point.evse
+        return evse.session if evse else None
 
     def _get_history(self) -> ChargingHistory | None:
         """Return the current charging history from the coordinator data.
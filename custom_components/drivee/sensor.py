@@ -7,6 +7,7 @@ import logging
 from decimal import Decimal
 from typing import Any
 
+from drivee_client.models.charging_history import ChargingHistory
 from drivee_client.models.price_periods import PricePeriods
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -15,8 +16,9 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfEnergy, UnitOfPower
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_change
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.util import dt as dt_util
 
@@ -168,6 +170,7 @@ class DriveeTotalEnergySensor(DriveeBaseSensorEntity, RestoreEntity):
         super().__init__(coordinator)
         self._last_finished_session_end: datetime.datetime | None = None
         self._total_wh: float = 0.0
+        self._processed_history: ChargingHistory | None = None
 
     async def async_added_to_hass(self) -> None:
         """Restore last known total and last finished session on restart."""
@@ -222,24 +225,33 @@ class DriveeTotalEnergySensor(DriveeBaseSensorEntity, RestoreEntity):
         if data is None:
             return
 
+        # The coordinator caches history for up to an hour while charge point
+        # data changes every poll, so skip histories that were already processed
+        history = data.charging_history
+        if history is self._processed_history:
+            return
+        self._processed_history = history
+
         total_wh: float = float(self._total_wh)
 
         sessions_ordered = sorted(
-            data.charging_history.sessions, key=lambda s: s.started_at, reverse=False
+            history.sessions, key=lambda s: s.started_at, reverse=False
         )
         if self._last_finished_session_end is None:
             # First initialization: mark existing sessions as processed but don't add energy
             # This ensures we only track NEW energy consumption from this point forward
+            processed_count = 0
             for session in sessions_ordered:
                 if session.stopped_at is not None:
                     # Don't add historical energy on first initialization
                     # Only mark sessions as processed to start counting from now
                     self._last_finished_session_end = session.stopped_at
+                    processed_count += 1
 
             _LOGGER.info(
                 "First initialization: marked %d historical sessions as processed, "
                 "starting total at %.1f kWh",
-                len([s for s in sessions_ordered if s.stopped_at is not None]),
+                processed_count,
                 self._total_wh / 1000,
             )
         else:
@@ -306,6 +318,34 @@ class DriveePriceSensor(DriveeBaseSensorEntity):
     _attr_native_unit_of_measurement: str = "kr/kWh"
     _attr_suggested_display_precision: int = 2
 
+    def __init__(self, coordinator: DriveeDataUpdateCoordinator) -> None:
+        """Initialize the price sensor."""
+        super().__init__(coordinator)
+        self._attributes: dict[str, Any] = {}
+        self._attributes_periods: PricePeriods | None = None
+        self._attributes_date: datetime.date | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh the state at every 15-minute price interval boundary.
+
+        The coordinator only notifies entities when the fetched data changes,
+        but the current price changes with the clock.
+        """
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_track_time_change(
+                self.hass,
+                self._async_price_interval_changed,
+                minute=range(0, 60, 15),
+                second=0,
+            )
+        )
+
+    @callback
+    def _async_price_interval_changed(self, now: datetime.datetime) -> None:
+        """Write state when a new price interval starts."""
+        self.async_write_ha_state()
+
     def _local_iso(self, dt_obj: datetime.datetime | None) -> str | None:
         """Convert datetime to Copenhagen local time ISO string.
 
@@ -326,18 +366,26 @@ class DriveePriceSensor(DriveeBaseSensorEntity):
         if dt_obj is None:
             return None
         local_tz = dt_util.DEFAULT_TIME_ZONE  # Copenhagen local timezone
-        _LOGGER.debug("original (provider) datetime %s", dt_obj.isoformat())
+        # Called for every price slot, so only format debug output when enabled
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug("original (provider) datetime %s", dt_obj.isoformat())
         # Normalize to local timezone
         if dt_obj.tzinfo is None:
             local_dt = dt_obj.replace(tzinfo=local_tz)
             # Provider sends times one hour ahead in winter (standard time, UTC+01:00)
             if not local_dt.dst():  # Standard time (no DST offset)
                 local_dt = local_dt - datetime.timedelta(hours=1)
-                _LOGGER.debug("adjusted winter local datetime %s", local_dt.isoformat())
+                if debug:
+                    _LOGGER.debug(
+                        "adjusted winter local datetime %s", local_dt.isoformat()
+                    )
         else:
             local_dt = dt_obj.astimezone(local_tz)
-        _LOGGER.debug("final local datetime %s", local_dt.isoformat())
-        return local_dt.isoformat()
+        local_iso = local_dt.isoformat()
+        if debug:
+            _LOGGER.debug("final local datetime %s", local_iso)
+        return local_iso
 
     @property
     def native_value(self) -> float | None:
@@ -359,17 +407,35 @@ class DriveePriceSensor(DriveeBaseSensorEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return generic price sensor attributes including prices_today and prices_tomorrow."""
+        """Return generic price sensor attributes including prices_today and prices_tomorrow.
+
+        The attributes only depend on the price periods and the current date,
+        so they are built once per coordinator snapshot and day and reused for
+        every state write in between.
+        """
         price_periods = self._get_price_periods()
         if not price_periods:
             return {"today": [], "tomorrow": [], "raw_today": [], "raw_tomorrow": []}
+        # Use timezone-aware date for consistency
+        today = dt_util.now().date()
+        if (
+            self._attributes_periods is not price_periods
+            or self._attributes_date != today
+        ):
+            self._attributes = self._build_price_attributes(price_periods, today)
+            self._attributes_periods = price_periods
+            self._attributes_date = today
+        return self._attributes
+
+    def _build_price_attributes(
+        self, price_periods: PricePeriods, today: datetime.date
+    ) -> dict[str, Any]:
+        """Build the today/tomorrow price attributes for the given date."""
         prices_today: list[dict[str, Any]] = []
         prices_tomorrow: list[dict[str, Any]] = []
         price_only_today: list[float] = []
         price_only_tomorrow: list[float] = []
         interval_minutes = 15
-        # Use timezone-aware date for consistency
-        today = dt_util.now().date()
         times_today = [
             (
                 datetime.datetime.combine(today, datetime.time(0, 0))
@@ -438,6 +504,21 @@ class DriveeLastRefreshSensor(DriveeBaseSensorEntity):
     _attr_icon = "mdi:update"
     _attr_device_class = SensorDeviceClass.TIMESTAMP
 
+    async def async_added_to_hass(self) -> None:
+        """Write state after every successful refresh.
+
+        The coordinator only notifies entities when the fetched data changes,
+        while the refresh time advances on every successful poll.
+        """
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_refresh_listener(self.async_write_ha_state)
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Skip data updates; the refresh listener already writes the state."""
+
     @property
     def native_value(self) -> datetime.datetime | None:
         """Return the time of the last successful refresh."""
@@ -9,7 +9,7 @@ from aiohttp import ClientError
 from drivee_client.errors import DriveeError
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -38,16 +38,36 @@ class DriveeChargingSwitch(DriveeBaseEntity, SwitchEntity):
     _attr_entity_category = EntityCategory.CONFIG
     _attr_should_poll = False
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if charging is active."""
+    def __init__(self, coordinator: DriveeDataUpdateCoordinator) -> None:
+        """Initialize the switch from the current coordinator data."""
+        super().__init__(coordinator)
+        self._update_from_charge_point()
+
+    def _update_from_charge_point(self) -> None:
+        """Cache `_attr_is_on` and `_attr_available` from the coordinator data."""
         charge_point = self._get_charge_point()
-        return charge_point.evse.is_charging_session_active
+        self._attr_available = charge_point is not None
+        self._attr_is_on = (
+            charge_point.evse.is_charging_session_active
+            if charge_point is not None
+            else None
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh the cached state in case data arrived after construction."""
+        await super().async_added_to_hass()
+        self._update_from_charge_point()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the cached state and write it to Home Assistant."""
+        self._update_from_charge_point()
+        super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
-        """Return True if charge point data is present."""
-        return self._get_charge_point() is not None
+        """Return True if charge point data was present at the last update."""
+        return self._attr_available
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the switch to start charging.
@@ -0,0 +1,100 @@
+"""Tests for Drivee binary sensor entities."""
+
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.drivee.binary_sensor import (
+    DriveeChargingBinarySensor,
+    DriveeEvseConnectedBinarySensor,
+)
+
+
+class TestDriveeEvseConnectedBinarySensor:
+    """Test DriveeEvseConnectedBinarySensor class."""
+
+    def test_state_cached_on_init(self, mock_coordinator):
+        """Test state is populated from coordinator data on creation."""
+        # Arrange
+        mock_coordinator.data.charge_point.evse.is_connected = True
+
+        # Act
+        sensor = DriveeEvseConnectedBinarySensor(mock_coordinator)
+
+        # Assert
+        assert sensor._attr_is_on is True
+        assert sensor.available is True
+
+    def test_state_updated_on_coordinator_update(self, mock_coordinator):
+        """Test coordinator updates refresh the cached state."""
+        # Arrange
+        mock_coordinator.data.charge_point.evse.is_connected = False
+        sensor = DriveeEvseConnectedBinarySensor(mock_coordinator)
+
+        # Act
+        mock_coordinator.data.charge_point.evse.is_connected = True
+        sensor._handle_coordinator_update()
+
+        # Assert
+        assert sensor._attr_is_on is True
+
+    def test_unavailable_without_data(self, mock_coordinator):
+        """Test sensor is unavailable before the first refresh."""
+        # Arrange
+        mock_coordinator.data = None
+
+        # Act
+        sensor = DriveeEvseConnectedBinarySensor(mock_coordinator)
+
+        # Assert
+        assert sensor._attr_is_on is None
+        assert sensor.available is False
+
+    async def test_state_refreshed_when_added(
+        self, hass: HomeAssistant, mock_coordinator, mock_coordinator_data
+    ):
+        """Test data that arrives before the sensor is added is picked up."""
+        # Arrange
+        mock_coordinator.data = None
+        sensor = DriveeEvseConnectedBinarySensor(mock_coordinator)
+        sensor.hass = hass
+        mock_coordinator_data.charge_point.evse.is_connected = True
+        mock_coordinator.data = mock_coordinator_data
+
+        # Act
+        await sensor.async_added_to_hass()
+
+        # Assert
+        assert sensor._attr_is_on is True
+        assert sensor.available is True
+
+
+class TestDriveeChargingBinarySensor:
+    """Test DriveeChargingBinarySensor class."""
+
+    def test_state_updated_on_coordinator_update(self, mock_coordinator):
+        """Test coordinator updates refresh the cached charging state."""
+        # Arrange
+        sensor = DriveeChargingBinarySensor(mock_coordinator)
+        assert sensor._attr_is_on is False
+
+        # Act
+        mock_coordinator.data.charge_point.evse.is_charging = True
+        sensor._handle_coordinator_update()
+
+        # Assert
+        assert sensor._attr_is_on is True
+        assert sensor.available is True
+
+    def test_unavailable_without_evse(self, mock_coordinator):
+        """Test sensor is unavailable when EVSE data is missing."""
+        # Arrange
+        sensor = DriveeChargingBinarySensor(mock_coordinator)
+
+        # Act
+        mock_coordinator.data.charge_point.evse = None
+        sensor._handle_coordinator_update()
+
+        # Assert
+        assert sensor._attr_is_on is None
+        assert sensor.available is False
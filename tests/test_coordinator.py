@@ -0,0 +1,200 @@
+"""Tests for DriveeDataUpdateCoordinator."""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+
+from drivee_client.models.charge_point import ChargePoint
+from drivee_client.models.charging_session import ChargingSession
+from drivee_client.models.evse import EVSE
+from homeassistant.core import HomeAssistant
+
+from custom_components.drivee.const import (
+    UPDATE_INTERVAL_CHARGING_SECONDS,
+    UPDATE_INTERVAL_CONNECTED_SECONDS,
+    UPDATE_INTERVAL_IDLE_MINUTES,
+)
+from custom_components.drivee.coordinator import (
+    DriveeData,
+    DriveeDataUpdateCoordinator,
+)
+
+
+def create_charge_point(energy: int = 1000) -> Mock:
+    """Create a charge point mock that is a distinct object on every call.
+
+    The mocks are specced against the client models so reading an attribute
+    the models do not have fails the test.
+    """
+    session = Mock(spec=ChargingSession)
+    session.id = "session-1"
+    session.energy = energy
+    session.power = 7000
+    session.amount = Decimal("1.50")
+    evse = Mock(spec=EVSE)
+    evse.id = "evse-1"
+    evse.status = "charging"
+    evse.is_charging = True
+    evse.is_connected = True
+    evse.is_charging_session_active = True
+    evse.session = session
+    charge_point = Mock(spec=ChargePoint)
+    charge_point.name = "Garage"
+    charge_point.evse = evse
+    return charge_point
+
+
+class TestUpdateInterval:
+    """Test the dynamic update interval selection."""
+
+    def test_interval_when_charging(self, mock_charge_point):
+        """Test charging uses the fast interval."""
+        # Arrange
+        mock_charge_point.evse.is_charging = True
+        mock_charge_point.evse.is_connected = True
+
+        # Act
+        result = DriveeDataUpdateCoordinator._interval_for_charge_point(
+            mock_charge_point
+        )
+
+        # Assert
+        assert result == timedelta(seconds=UPDATE_INTERVAL_CHARGING_SECONDS)
+
+    def test_interval_when_connected(self, mock_charge_point):
+        """Test a connected but idle car uses the intermediate interval."""
+        # Arrange
+        mock_charge_point.evse.is_charging = False
+        mock_charge_point.evse.is_connected = True
+
+        # Act
+        result = DriveeDataUpdateCoordinator._interval_for_charge_point(
+            mock_charge_point
+        )
+
+        # Assert
+        assert result == timedelta(seconds=UPDATE_INTERVAL_CONNECTED_SECONDS)
+
+    def test_interval_when_disconnected(self, mock_charge_point):
+        """Test a disconnected charger uses the slow interval."""
+        # Arrange
+        mock_charge_point.evse.is_charging = False
+        mock_charge_point.evse.is_connected = False
+
+        # Act
+        result = DriveeDataUpdateCoordinator._interval_for_charge_point(
+            mock_charge_point
+        )
+
+        # Assert
+        assert result == timedelta(minutes=UPDATE_INTERVAL_IDLE_MINUTES)
+
+
+class TestDriveeData:
+    """Test the DriveeData container."""
+
+    def test_equal_for_separately_built_charge_points(
+        self, mock_charging_history, mock_price_periods
+    ):
+        """Test separately fetched charge points with the same values compare equal."""
+        # Arrange
+        first = DriveeData(
+            charge_point=create_charge_point(),
+            charging_history=mock_charging_history,
+            price_periods=mock_price_periods,
+        )
+        second = DriveeData(
+            charge_point=create_charge_point(),
+            charging_history=mock_charging_history,
+            price_periods=mock_price_periods,
+        )
+
+        # Act & Assert
+        assert first.charge_point is not second.charge_point
+        assert first == second
+
+    def test_not_equal_when_session_energy_changes(
+        self, mock_charging_history, mock_price_periods
+    ):
+        """Test a change in the current session is detected."""
+        # Arrange
+        first = DriveeData(
+            charge_point=create_charge_point(energy=1000),
+            charging_history=mock_charging_history,
+            price_periods=mock_price_periods,
+        )
+        second = DriveeData(
+            charge_point=create_charge_point(energy=2000),
+            charging_history=mock_charging_history,
+            price_periods=mock_price_periods,
+        )
+
+        # Act & Assert
+        assert first != second
+
+    def test_not_equal_when_history_refetched(self, mock_price_periods):
+        """Test a newly fetched history object is treated as a change."""
+        # Arrange
+        first = DriveeData(
+            charge_point=create_charge_point(),
+            charging_history=Mock(),
+            price_periods=mock_price_periods,
+        )
+        second = DriveeData(
+            charge_point=create_charge_point(),
+            charging_history=Mock(),
+            price_periods=mock_price_periods,
+        )
+
+        # Act & Assert
+        assert first != second
+
+
+class TestRefreshListener:
+    """Test listeners that run on every successful refresh."""
+
+    async def test_called_when_data_unchanged(
+        self,
+        hass: HomeAssistant,
+        mock_charging_history,
+        mock_price_periods,
+    ):
+        """Test refresh listeners run even when the data did not change."""
+        # Arrange
+        client = Mock()
+        client.get_charge_point = AsyncMock(side_effect=lambda: create_charge_point())
+        client.get_charging_history = AsyncMock(return_value=mock_charging_history)
+        client.get_price_periods = AsyncMock(return_value=mock_price_periods)
+        coordinator = DriveeDataUpdateCoordinator(
+            hass,
+            logging.getLogger(__name__),
+            name="drivee",
+            update_interval=timedelta(minutes=UPDATE_INTERVAL_IDLE_MINUTES),
+            client=client,
+            config_entry=None,
+        )
+        seen_charge_points = []
+
+        def refresh_callback() -> None:
+            assert coordinator.last_update_success
+            seen_charge_points.append(coordinator.data.charge_point)
+
+        data_callback = Mock()
+        remove_refresh = coordinator.async_add_refresh_listener(refresh_callback)
+        remove_data = coordinator.async_add_listener(data_callback)
+
+        # Act
+        await coordinator.async_refresh()
+        first_charge_point = coordinator.data.charge_point
+        await coordinator.async_refresh()
+        second_charge_point = coordinator.data.charge_point
+        remove_refresh()
+        await coordinator.async_refresh()
+        remove_data()
+
+        # Assert
+        assert seen_charge_points == [first_charge_point, second_charge_point]
+        assert data_callback.call_count == 1
@@ -0,0 +1,36 @@
+"""Tests for Drivee integration setup."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+from aiohttp import ClientError
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.drivee.const import DOMAIN
+
+
+class TestSetupEntry:
+    """Test setting up a config entry."""
+
+    async def test_failed_first_refresh_retries_setup(self, hass: HomeAssistant):
+        """Test a failed first refresh puts the entry into setup retry."""
+        # Arrange
+        entry = MockConfigEntry(
+            domain=DOMAIN, data={"username": "user", "password": "pass"}
+        )
+        entry.add_to_hass(hass)
+
+        # Act
+        with patch("custom_components.drivee.DriveeClient") as client_class:
+            client_class.return_value.get_charge_point = AsyncMock(
+                side_effect=ClientError("boom")
+            )
+            await hass.config_entries.async_setup(entry.entry_id)
+            await hass.async_block_till_done()
+
+        # Assert
+        assert entry.state is ConfigEntryState.SETUP_RETRY
+        assert entry.entry_id not in hass.data.get(DOMAIN, {})
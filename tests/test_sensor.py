@@ -12,7 +12,7 @@ from homeassistant.helpers.restore_state import State
 from homeassistant.util import dt as dt_util
 
 from custom_components.drivee.coordinator import DriveeData
-from custom_components.drivee.sensor import DriveeTotalEnergySensor
+from custom_components.drivee.sensor import DriveePriceSensor, DriveeTotalEnergySensor
 
 
 def create_mock_session(
@@ -487,3 +487,71 @@ class TestDriveeTotalEnergySensor:
 
         # Assert: Total should remain unchanged
         assert sensor._total_wh == 50000.0
+
+    def test_same_history_processed_once(self, mock_coordinator, mock_charging_history):
+        """Test a history snapshot is only processed once across updates."""
+        # Arrange
+        now = dt_util.now()
+        marker = now - datetime.timedelta(hours=3)
+        mock_charging_history.sessions = [
+            create_mock_session(
+                "session-new",
+                now - datetime.timedelta(hours=1),
+                now - datetime.timedelta(minutes=30),
+                25000.0,
+            ),
+        ]
+        sensor = DriveeTotalEnergySensor(mock_coordinator)
+        sensor._last_finished_session_end = marker
+        sensor._on_session_end_update_total()
+        assert sensor._total_wh == 25000.0
+
+        # Act: Rewind the marker; the unchanged history must not be re-added
+        sensor._last_finished_session_end = marker
+        sensor._on_session_end_update_total()
+
+        # Assert
+        assert sensor._total_wh == 25000.0
+
+
+class TestDriveePriceSensor:
+    """Test DriveePriceSensor class."""
+
+    def test_extra_state_attributes_reused_for_same_data(
+        self, mock_coordinator, mock_price_periods
+    ):
+        """Test price attributes are built once per coordinator snapshot."""
+        # Arrange
+        sensor = DriveePriceSensor(mock_coordinator)
+
+        # Act
+        first = sensor.extra_state_attributes
+        calls_after_first = mock_price_periods.get_price_at.call_count
+        second = sensor.extra_state_attributes
+
+        # Assert
+        assert second is first
+        assert len(first["today"]) == 96
+        assert len(first["tomorrow"]) == 96
+        assert mock_price_periods.get_price_at.call_count == calls_after_first
+
+    def test_extra_state_attributes_rebuilt_for_new_data(
+        self, mock_coordinator, mock_charge_point, mock_charging_history
+    ):
+        """Test price attributes are rebuilt when new price periods arrive."""
+        # Arrange
+        sensor = DriveePriceSensor(mock_coordinator)
+        first = sensor.extra_state_attributes
+        new_periods = Mock()
+        mock_coordinator.data = DriveeData(
+            charge_point=mock_charge_point,
+            charging_history=mock_charging_history,
+            price_periods=new_periods,
+        )
+
+        # Act
+        second = sensor.extra_state_attributes
+
+        # Assert
+        assert second is not first
+        new_periods.get_price_at.assert_called()
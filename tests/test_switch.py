@@ -0,0 +1,56 @@
+"""Tests for Drivee switch entities."""
+
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.drivee.switch import DriveeChargingSwitch
+
+
+class TestDriveeChargingSwitch:
+    """Test DriveeChargingSwitch class."""
+
+    def test_state_updated_on_coordinator_update(self, mock_coordinator):
+        """Test coordinator updates refresh the cached switch state."""
+        # Arrange
+        mock_coordinator.data.charge_point.evse.is_charging_session_active = False
+        switch = DriveeChargingSwitch(mock_coordinator)
+        assert switch._attr_is_on is False
+
+        # Act
+        mock_coordinator.data.charge_point.evse.is_charging_session_active = True
+        switch._handle_coordinator_update()
+
+        # Assert
+        assert switch._attr_is_on is True
+        assert switch.available is True
+
+    def test_unavailable_without_data(self, mock_coordinator):
+        """Test switch is unavailable before the first refresh."""
+        # Arrange
+        mock_coordinator.data = None
+
+        # Act
+        switch = DriveeChargingSwitch(mock_coordinator)
+
+        # Assert
+        assert switch._attr_is_on is None
+        assert switch.available is False
+
+    async def test_state_refreshed_when_added(
+        self, hass: HomeAssistant, mock_coordinator, mock_coordinator_data
+    ):
+        """Test data that arrives before the switch is added is picked up."""
+        # Arrange
+        mock_coordinator.data = None
+        switch = DriveeChargingSwitch(mock_coordinator)
+        switch.hass = hass
+        mock_coordinator_data.charge_point.evse.is_charging_session_active = True
+        mock_coordinator.data = mock_coordinator_data
+
+        # Act
+        await switch.async_added_to_hass()
+
+        # Assert
+        assert switch._attr_is_on is True
+        assert switch.available is True